@@ -3,7 +3,8 @@
 
 Default mode is *auto*:
 - If --mode interactive is specified, start a session in tmux.
-- Otherwise run headless (codex exec) through macOS BSD `script(1)` for a pseudo-terminal.
+- Otherwise run headless (codex exec) through macOS BSD `script(1)` for a pseudo-terminal
+  (skipped when stdin/stdout are already a terminal).
 
 Why this wrapper exists:
 - Codex can hang when run without a TTY in some environments.
@@ -21,47 +22,93 @@ Docs: https://github.com/openai/codex
 
 from __future__ import annotations
 
-import argparse
+# Only modules that subprocess loads anyway are imported eagerly; argparse
+# and shlex are imported where they are used to keep cold-start cheap for
+# one-shot runs.
+import collections
+import functools
+import io
 import os
-import shlex
+import signal
+import stat
 import subprocess
 import sys
 import time
-from pathlib import Path
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from typing import NoReturn
 
 DEFAULT_CODEX = os.environ.get("CODEX_BIN", "")
 DEFAULT_LOG_DIR = os.path.expanduser("~/.claude/logs/headless")
 
+# PATH is parsed once per process, with duplicate and nonexistent entries
+# dropped up front; which() results are cached on top of it
+_PATH_DIRS = tuple(
+    p for p in dict.fromkeys(os.environ.get("PATH", "").split(":"))
+    if p and os.path.isdir(p)
+)
 
-def is_inside_git_repo(path: str | None = None) -> bool:
-    """Check if the given path (or cwd) is inside a Git repository."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            cwd=path or os.getcwd(),
-            capture_output=True,
-            timeout=5,
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, OSError):
-        return False
 
+def is_inside_git_repo(path: str | None = None, strict: bool = False) -> bool:
+    """Check if the given path (or cwd) is inside a Git repository.
 
+    By default this walks up the directory tree looking for a `.git` entry,
+    which avoids spawning git. A `.git` file (worktree / submodule) counts
+    only if its `gitdir:` target exists. With strict=True, defer to
+    `git rev-parse --is-inside-work-tree`.
+    """
+    if strict:
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "--is-inside-work-tree"],
+                cwd=path or os.getcwd(),
+                capture_output=True,
+                timeout=5,
+            )
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+
+    d = os.path.realpath(path or os.getcwd())
+    while True:
+        dotgit = os.path.join(d, ".git")
+        if os.path.isdir(dotgit):
+            return True
+        if os.path.isfile(dotgit):
+            try:
+                with open(dotgit) as f:
+                    first = f.readline().strip()
+            except OSError:
+                first = ""
+            if first.startswith("gitdir:"):
+                gitdir = first[len("gitdir:"):].strip()
+                if os.path.exists(os.path.join(d, gitdir)):
+                    return True
+        parent = os.path.dirname(d)
+        if parent == d:
+            return False
+        d = parent
+
+
+@functools.lru_cache(maxsize=None)
 def which(name: str) -> str | None:
-    """Find an executable on PATH."""
-    for p in os.environ.get("PATH", "").split(":"):
-        cand = Path(p) / name
+    """Find an executable on PATH (memoized per process)."""
+    for d in _PATH_DIRS:
+        cand = os.path.join(d, name)
         try:
-            if cand.is_file() and os.access(cand, os.X_OK):
-                return str(cand)
+            st = os.stat(cand)
         except OSError:
-            pass
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+            return cand
     return None
 
 
 def resolve_codex_bin(explicit: str) -> str | None:
     """Resolve the codex binary path."""
-    if explicit and Path(explicit).exists():
+    if explicit and os.path.exists(explicit):
         return explicit
     # Try common locations
     for name in ("codex",):
@@ -75,11 +122,61 @@ def resolve_codex_bin(explicit: str) -> str | None:
     return None
 
 
+def spawn_quiet(name: str, argv: list[str], stdin_fd: int | None = None) -> int | None:
+    """posix_spawn a helper found on PATH, with stdout/stderr sent to /dev/null.
+
+    Cheaper than subprocess for tiny fire-and-forget helpers (osascript,
+    pbcopy). stdin comes from stdin_fd if given, else /dev/null. Returns the
+    child PID, or None if the executable is not on PATH.
+    """
+    path = which(name)
+    if not path:
+        return None
+    if stdin_fd is not None:
+        stdin_action = (os.POSIX_SPAWN_DUP2, stdin_fd, 0)
+    else:
+        stdin_action = (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0)
+    return os.posix_spawn(path, argv, os.environ, file_actions=[
+        stdin_action,
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ])
+
+
+def spawn_pbcopy() -> tuple[int, io.BufferedWriter] | None:
+    """Start pbcopy reading from a pipe. Returns (pid, pipe writer) or None."""
+    r, w = os.pipe()
+    try:
+        pid = spawn_quiet("pbcopy", ["pbcopy"], stdin_fd=r)
+    except OSError:
+        pid = None
+    finally:
+        os.close(r)
+    if pid is None:
+        os.close(w)
+        return None
+    return pid, os.fdopen(w, "wb")
+
+
+def reap_bounded(pid: int, timeout_s: float = 5) -> None:
+    """Reap a helper child, killing it if it is still running after timeout_s
+    (e.g. osascript stuck on an Automation permission prompt)."""
+    deadline = time.time() + timeout_s
+    while os.waitpid(pid, os.WNOHANG)[0] == 0:
+        if time.time() >= deadline:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            return
+        time.sleep(0.01)
+
+
 def notify_macos(title: str, message: str) -> None:
     """Send a macOS desktop notification via osascript."""
     try:
         script = f'display notification "{message}" with title "{title}"'
-        subprocess.run(["osascript", "-e", script], capture_output=True, timeout=5)
+        pid = spawn_quiet("osascript", ["osascript", "-e", script])
+        if pid:
+            reap_bounded(pid)
     except Exception:
         pass
 
@@ -87,50 +184,70 @@ def notify_macos(title: str, message: str) -> None:
 def copy_to_clipboard(text: str) -> None:
     """Copy text to macOS clipboard via pbcopy."""
     try:
-        proc = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
-        proc.communicate(input=text.encode("utf-8"), timeout=5)
+        spawned = spawn_pbcopy()
+        if not spawned:
+            return
+        pid, pipe = spawned
+        with pipe:
+            pipe.write(text.encode("utf-8"))
+        reap_bounded(pid)
     except Exception:
         pass
 
 
+# (args attribute, kind, codex flag): "bool" adds the flag alone, "val" adds
+# flag + value, "list" repeats flag + value for each item. Order is kept.
+_FLAG_SPEC: tuple[tuple[str, str, str], ...] = (
+    ("model", "val", "-m"),
+    ("sandbox", "val", "--sandbox"),
+    ("full_auto", "bool", "--full-auto"),
+    ("profile", "val", "-p"),
+    ("cd", "val", "--cd"),
+    ("image", "list", "-i"),
+    ("json_output", "bool", "--json"),
+    ("output_file", "val", "-o"),
+    ("output_schema", "val", "--output-schema"),
+    ("ephemeral", "bool", "--ephemeral"),
+    ("skip_git_repo_check", "bool", "--skip-git-repo-check"),
+    ("add_dir", "list", "--add-dir"),
+    ("yolo", "bool", "--yolo"),
+    ("oss", "bool", "--oss"),
+    ("local_provider", "val", "--local-provider"),
+    ("color", "val", "--color"),
+)
+
+# Subset forwarded to the interactive TUI launch in tmux
+_INTERACTIVE_FLAG_SPEC: tuple[tuple[str, str, str], ...] = (
+    ("model", "val", "-m"),
+    ("sandbox", "val", "--sandbox"),
+    ("full_auto", "bool", "--full-auto"),
+    ("profile", "val", "-p"),
+)
+
+
+def append_flags(
+    out: list[str], args: argparse.Namespace, spec: tuple[tuple[str, str, str], ...]
+) -> list[str]:
+    """Append codex flags for the set attributes of `args` per `spec`."""
+    append = out.append
+    extend = out.extend
+    for attr, kind, flag in spec:
+        v = getattr(args, attr)
+        if not v:
+            continue
+        if kind == "bool":
+            append(flag)
+        elif kind == "val":
+            extend((flag, v))
+        else:
+            for x in v:
+                extend((flag, x))
+    return out
+
+
 def build_headless_cmd(args: argparse.Namespace) -> list[str]:
     """Build the codex exec command for headless mode."""
-    cmd: list[str] = [args.codex_bin, "exec"]
-
-    if args.model:
-        cmd += ["-m", args.model]
-    if args.sandbox:
-        cmd += ["--sandbox", args.sandbox]
-    if args.full_auto:
-        cmd.append("--full-auto")
-    if args.profile:
-        cmd += ["-p", args.profile]
-    if args.cd:
-        cmd += ["--cd", args.cd]
-    if args.image:
-        for img in args.image:
-            cmd += ["-i", img]
-    if args.json_output:
-        cmd.append("--json")
-    if args.output_file:
-        cmd += ["-o", args.output_file]
-    if args.output_schema:
-        cmd += ["--output-schema", args.output_schema]
-    if args.ephemeral:
-        cmd.append("--ephemeral")
-    if args.skip_git_repo_check:
-        cmd.append("--skip-git-repo-check")
-    if args.add_dir:
-        for d in args.add_dir:
-            cmd += ["--add-dir", d]
-    if args.yolo:
-        cmd.append("--yolo")
-    if args.oss:
-        cmd.append("--oss")
-    if args.local_provider:
-        cmd += ["--local-provider", args.local_provider]
-    if args.color:
-        cmd += ["--color", args.color]
+    cmd = append_flags([args.codex_bin, "exec"], args, _FLAG_SPEC)
     if args.extra:
         cmd += args.extra
 
@@ -141,20 +258,86 @@ def build_headless_cmd(args: argparse.Namespace) -> list[str]:
     return cmd
 
 
-def run_background(cmd: list[str], cwd: str | None, log_dir: str, notify: bool = False) -> int:
+def close_fds_except(*keep: int) -> None:
+    """Close every fd >= 3 except `keep`, so a forked daemon does not hold
+    (or pass on) pipes and files inherited from our caller."""
+    try:
+        max_fd = os.sysconf("SC_OPEN_MAX")
+    except (ValueError, OSError):
+        max_fd = 256
+    lo = 3
+    for fd in sorted(k for k in keep if k >= 3):
+        os.closerange(lo, fd)
+        lo = fd + 1
+    os.closerange(lo, max(max_fd, lo))
+
+
+def spawn_supervised(full_cmd: list[str], cwd: str, log_fd: int, title: str) -> int:
+    """Start `full_cmd` under a detached supervisor that notifies on exit.
+
+    The supervisor (a double-forked grandchild in its own session, holding
+    no fds inherited from our caller) spawns the command with stdout/stderr
+    on `log_fd`, reports its PID back over a pipe, then blocks in
+    os.waitpid() on its own child (no polling) before sending the
+    notification. Returns the command's PID.
+    """
+    r, w = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    child = os.fork()
+    if child:
+        os.close(w)
+        with os.fdopen(r, "rb") as pipe:
+            data = pipe.read()
+        os.waitpid(child, 0)
+        if not data:
+            raise OSError(f"failed to start {full_cmd[0]}")
+        return int(data)
+
+    try:
+        os.close(r)
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        close_fds_except(w, log_fd)
+        os.chdir(cwd)
+        pid = os.posix_spawnp(full_cmd[0], full_cmd, os.environ, file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_DUP2, log_fd, 1),
+            (os.POSIX_SPAWN_DUP2, log_fd, 2),
+        ])
+        os.write(w, str(pid).encode())
+        os.close(w)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        os.waitpid(pid, 0)
+        notify_macos(title, f"Background task finished (PID {pid})")
+    finally:
+        os._exit(0)
+
+
+def run_background(cmd: list[str], cwd: str, log_dir: str, notify: bool = False) -> int:
     """Run a command in the background (non-blocking), returning immediately.
 
     Writes stdout/stderr to a timestamped log file and prints the PID
     and log path so the caller can monitor progress later.
     """
-    os.makedirs(log_dir, exist_ok=True)
-    timestamp = time.strftime("%Y%m%d-%H%M%S")
-    log_file = os.path.join(log_dir, f"codex-{timestamp}.log")
+    import shlex
 
-    with open(log_file, "w") as lf:
-        lf.write(f"# Command: {' '.join(shlex.quote(c) for c in cmd)}\n")
-        lf.write(f"# Started: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        lf.write(f"# CWD: {cwd or os.getcwd()}\n\n")
+    os.makedirs(log_dir, exist_ok=True)
+    now = time.localtime()
+    log_file = os.path.join(log_dir, f"codex-{time.strftime('%Y%m%d-%H%M%S', now)}.log")
+    header = (
+        f"# Command: {shlex.join(cmd)}\n"
+        f"# Started: {time.strftime('%Y-%m-%d %H:%M:%S', now)}\n"
+        f"# CWD: {cwd}\n\n"
+    ).encode()
+
+    # The child writes to the log fd directly; the header goes out in one
+    # write() and must be flushed before the child starts.
+    with open(log_file, "wb", buffering=65536) as lf:
+        lf.write(header)
         lf.flush()
 
         script_bin = which("script")
@@ -163,47 +346,46 @@ def run_background(cmd: list[str], cwd: str | None, log_dir: str, notify: bool =
         else:
             full_cmd = cmd
 
-        proc = subprocess.Popen(
-            full_cmd,
-            cwd=cwd,
-            stdout=lf,
-            stderr=subprocess.STDOUT,
-            stdin=subprocess.DEVNULL,
-            start_new_session=True,
-        )
+        if notify:
+            # A supervisor owns codex so it can waitpid() for the exit
+            pid = spawn_supervised(full_cmd, cwd, lf.fileno(), "Codex")
+        else:
+            pid = subprocess.Popen(
+                full_cmd,
+                cwd=cwd,
+                stdout=lf,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True,
+            ).pid
 
     print(f"Background process started:")
-    print(f"  PID:  {proc.pid}")
+    print(f"  PID:  {pid}")
     print(f"  Log:  {log_file}")
     print(f"  Tail: tail -f {shlex.quote(log_file)}")
-    print(f"  Stop: kill {proc.pid}")
-
-    if notify:
-        watcher_script = (
-            f"while kill -0 {proc.pid} 2>/dev/null; do sleep 2; done; "
-            f"osascript -e 'display notification \"Background task finished (PID {proc.pid})\" "
-            f"with title \"Codex\"'"
-        )
-        subprocess.Popen(
-            ["bash", "-c", watcher_script],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL,
-            start_new_session=True,
-        )
+    print(f"  Stop: kill {pid}")
 
     return 0
 
 
+def has_tty() -> bool:
+    """True when stdin and stdout are already a terminal, so codex gets a TTY
+    without the script(1) wrapper. Works on the raw fds, so a closed stdin
+    (sys.stdin is None) just means "no TTY"."""
+    return os.isatty(0) and os.isatty(1)
+
+
 def run_with_pty(cmd: list[str], cwd: str | None) -> int:
     """Run a command with a pseudo-terminal via macOS BSD script(1).
 
     macOS syntax:  script -q /dev/null cmd arg1 arg2 ...
     Linux syntax:  script -q -c "cmd arg1 arg2" /dev/null  (DO NOT use on macOS)
+
+    The wrapper is skipped when we are already attached to a terminal.
     """
-    script_bin = which("script")
+    script_bin = None if has_tty() else which("script")
     if not script_bin:
-        # Fallback: run directly without PTY
+        # Already on a TTY, or fallback: run directly without PTY
         proc = subprocess.run(cmd, cwd=cwd)
         return proc.returncode
 
@@ -213,6 +395,113 @@ def run_with_pty(cmd: list[str], cwd: str | None) -> int:
     return proc.returncode
 
 
+def exec_with_pty(cmd: list[str], cwd: str | None) -> NoReturn:
+    """Replace this process with `script -q /dev/null cmd...` (see run_with_pty).
+
+    Used when the wrapper has no work left after codex exits, saving a
+    process, a wait and the Python shutdown. On a terminal codex is exec'd
+    directly.
+    """
+    script_bin = None if has_tty() else which("script")
+    full_cmd = [script_bin, "-q", "/dev/null"] + cmd if script_bin else cmd
+    if cwd:
+        os.chdir(cwd)
+    for stream in (sys.stdout, sys.stderr):
+        if stream is not None:
+            stream.flush()
+    os.execvp(full_cmd[0], full_cmd)
+
+
+def agent_message_text(line: bytes) -> str | None:
+    """Return the agent message text from one `codex exec --json` line.
+
+    Handles the `item.completed` shape ({"item": {"type": "agent_message",
+    "text": ...}}) as well as the older {"msg": {"type": "agent_message",
+    "message": ...}}. Returns None for any other event or non-JSON line.
+    """
+    if b"agent_message" not in line:
+        return None
+    import json
+
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(event, dict):
+        return None
+    for body in (event.get("item"), event.get("msg"), event):
+        if isinstance(body, dict) and body.get("type") == "agent_message":
+            text = body.get("text", body.get("message"))
+            return text if isinstance(text, str) else None
+    return None
+
+
+def run_with_clipboard(cmd: list[str], cwd: str | None, json_final: bool = False) -> int:
+    """Run a command under script(1), streaming its output to the terminal
+    and to pbcopy as it arrives instead of buffering the whole session.
+
+    With json_final (codex --json), only the last agent message is copied,
+    once codex exits. Output stays raw bytes throughout: only the last few
+    lines that may hold an agent message are kept, undecoded, and parsed at
+    EOF, newest first.
+    """
+    script_bin = which("script")
+    full_cmd = [script_bin, "-q", "/dev/null"] + cmd if script_bin else cmd
+
+    if json_final:
+        pbcopy_pid, pbcopy_pipe = None, None
+    else:
+        pbcopy_pid, pbcopy_pipe = spawn_pbcopy() or (None, None)
+    pbcopy = pbcopy_pipe
+    pending = bytearray()
+    candidates: collections.deque[bytearray] = collections.deque(maxlen=8)
+
+    proc = subprocess.Popen(
+        full_cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=65536,
+    )
+    out = sys.stdout.buffer
+    for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+        out.write(chunk)
+        out.flush()
+        if json_final:
+            # Only the unfinished line is carried over, and a chunk's bytes
+            # are split once, so a long line costs linear time
+            nl = chunk.rfind(b"\n")
+            if nl < 0:
+                pending += chunk
+                continue
+            pending += chunk[:nl]
+            candidates.extend(
+                ln for ln in pending.split(b"\n") if b"agent_message" in ln
+            )
+            pending = bytearray(chunk[nl + 1:])
+        elif pbcopy:
+            try:
+                pbcopy.write(chunk)
+            except OSError:
+                pbcopy = None
+    rc = proc.wait()
+
+    if json_final:
+        candidates.append(pending)
+        for ln in reversed(candidates):
+            text = agent_message_text(ln)
+            if text is not None:
+                copy_to_clipboard(text)
+                break
+    if pbcopy_pid:
+        try:
+            pbcopy_pipe.close()
+        except OSError:
+            pass
+        reap_bounded(pbcopy_pid)
+    return rc
+
+
 # --- tmux interactive mode ---
 
 def tmux_cmd(*args: str) -> list[str]:
@@ -220,6 +509,20 @@ def tmux_cmd(*args: str) -> list[str]:
     return ["tmux", *args]
 
 
+def tmux_chain(*cmds: list[str]) -> list[str]:
+    """Build a single tmux invocation running several commands in sequence.
+
+    tmux splits argv on arguments ending in ';', so a trailing ';' inside an
+    argument is escaped as '\\;' to keep it literal.
+    """
+    argv = ["tmux"]
+    for i, cmd in enumerate(cmds):
+        if i:
+            argv.append(";")
+        argv += [a[:-1] + "\\;" if a.endswith(";") else a for a in cmd]
+    return argv
+
+
 def tmux_capture(target: str, lines: int = 200) -> str:
     """Capture tmux pane content."""
     return subprocess.check_output(
@@ -244,8 +547,44 @@ def tmux_wait_for_text(
     return False
 
 
+def wait_for_prompt_ready(
+    target: str, marker: str, before: str, timeout_s: float,
+    poll_s: float = 0.1, max_poll_s: float = 1.0,
+) -> bool:
+    """Wait until a tmux pane shows a fresh, empty prompt.
+
+    Ready means the visible screen differs from `before` (captured just
+    before the last send) and the cursor line is exactly `marker`, ignoring
+    trailing blanks, which capture-pane drops. The echoed input line does
+    not count. The poll interval starts at poll_s and doubles up to
+    max_poll_s. Returns False once timeout_s has passed.
+    """
+    deadline = time.time() + timeout_s
+    want = marker.rstrip()
+    while True:
+        try:
+            out = subprocess.check_output(tmux_chain(
+                ["display-message", "-p", "-t", target, "#{cursor_y}"],
+                ["capture-pane", "-p", "-t", target],
+            ), text=True)
+            cursor_y, _, screen = out.partition("\n")
+            rows = screen.split("\n")
+            y = int(cursor_y)
+            if screen != before and y < len(rows) and rows[y].rstrip() == want:
+                return True
+        except (subprocess.CalledProcessError, ValueError):
+            pass
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(poll_s, remaining))
+        poll_s = min(poll_s * 2, max_poll_s)
+
+
 def run_interactive_tmux(args: argparse.Namespace) -> int:
     """Start Codex interactively inside a tmux session."""
+    import shlex
+
     if not which("tmux"):
         print("Error: tmux not found. Install via: brew install tmux", file=sys.stderr)
         return 2
@@ -253,47 +592,49 @@ def run_interactive_tmux(args: argparse.Namespace) -> int:
     session = args.tmux_session
     target = f"{session}:0.0"
 
-    # Kill existing session if any
-    subprocess.run(
-        tmux_cmd("kill-session", "-t", session),
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-    subprocess.check_call(tmux_cmd("new", "-d", "-s", session, "-n", "codex"))
-
-    cwd = args.cd or os.getcwd()
-
     # Build the codex launch command (interactive TUI, not exec)
-    codex_parts = [args.codex_bin]
-    if args.model:
-        codex_parts += ["-m", args.model]
-    if args.sandbox:
-        codex_parts += ["--sandbox", args.sandbox]
-    if args.full_auto:
-        codex_parts.append("--full-auto")
-    if args.profile:
-        codex_parts += ["-p", args.profile]
+    codex_parts = append_flags([args.codex_bin], args, _INTERACTIVE_FLAG_SPEC)
     if args.extra:
         codex_parts += args.extra
+    launch = f"cd {shlex.quote(args.workdir)} && {shlex.join(codex_parts)}"
 
-    launch = f"cd {shlex.quote(cwd)} && " + " ".join(
-        shlex.quote(p) for p in codex_parts
-    )
-    subprocess.check_call(
-        tmux_cmd("send-keys", "-t", target, "-l", "--", launch)
+    # Kill existing session if any. This stays a separate call: a failing
+    # command aborts the rest of a tmux command sequence.
+    subprocess.run(
+        tmux_cmd("kill-session", "-t", session),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    subprocess.check_call(tmux_cmd("send-keys", "-t", target, "Enter"))
+    # Create the session and type the launch command in one invocation
+    subprocess.check_call(tmux_chain(
+        ["new", "-d", "-s", session, "-n", "codex"],
+        ["send-keys", "-t", target, "-l", "--", launch],
+        ["send-keys", "-t", target, "Enter"],
+    ))
 
     # Wait for codex to be ready, then send prompt
     time.sleep(3)
 
+    def send_line(line: str) -> None:
+        # Snapshot the screen, then type the line + Enter, all in one tmux
+        # invocation (one fork per line)
+        before = subprocess.check_output(tmux_chain(
+            ["capture-pane", "-p", "-t", target],
+            ["send-keys", "-t", target, "-l", "--", line],
+            ["send-keys", "-t", target, "Enter"],
+        ), text=True)
+        # Pace lines by prompt readiness; the delay is only an upper bound
+        delay_s = args.interactive_send_delay_ms / 1000.0
+        if args.interactive_prompt_marker.strip():
+            wait_for_prompt_ready(
+                target, args.interactive_prompt_marker, before, timeout_s=delay_s
+            )
+        else:
+            time.sleep(delay_s)
+
     if args.prompt:
         for line in (ln for ln in args.prompt.splitlines() if ln.strip()):
-            subprocess.check_call(
-                tmux_cmd("send-keys", "-t", target, "-l", "--", line)
-            )
-            subprocess.check_call(tmux_cmd("send-keys", "-t", target, "Enter"))
-            time.sleep(args.interactive_send_delay_ms / 1000.0)
+            send_line(line)
 
     print(f"Interactive Codex started in tmux session: {session}")
     print(f"  Attach:   tmux attach -t {shlex.quote(session)}")
@@ -313,6 +654,8 @@ def run_interactive_tmux(args: argparse.Namespace) -> int:
 
 
 def main() -> int:
+    import argparse
+
     ap = argparse.ArgumentParser(
         description="Run OpenAI Codex reliably on macOS (headless or interactive via tmux)"
     )
@@ -387,6 +730,11 @@ def main() -> int:
         action="store_true",
         help="Allow running outside a Git repository",
     )
+    ap.add_argument(
+        "--strict-git-check",
+        action="store_true",
+        help="Detect Git repositories via `git rev-parse` instead of looking for .git",
+    )
     ap.add_argument(
         "--add-dir",
         action="append",
@@ -439,7 +787,8 @@ def main() -> int:
     ap.add_argument(
         "--clipboard",
         action="store_true",
-        help="Copy output to macOS clipboard via pbcopy",
+        help="Copy output to macOS clipboard via pbcopy "
+        "(with --json, only the final agent message)",
     )
 
     # tmux options
@@ -454,7 +803,15 @@ def main() -> int:
         "--interactive-send-delay-ms",
         type=int,
         default=800,
-        help="Delay (ms) between sending lines in interactive mode",
+        help="Max delay (ms) between sending lines in interactive mode",
+    )
+    ap.add_argument(
+        "--interactive-prompt-marker",
+        default="",
+        help="Exact cursor line shown by codex when it is ready for the next "
+        "line; when set, lines are sent as soon as it appears. Off by default "
+        "(always wait the full delay), since the Codex composer shows "
+        "placeholder text after its prompt.",
     )
 
     ap.add_argument("extra", nargs=argparse.REMAINDER, help="Extra args passed to codex (after --)")
@@ -467,6 +824,10 @@ def main() -> int:
         extra = extra[1:]
     args.extra = extra
 
+    # Resolve the working directory once; everything below uses args.workdir.
+    # args.cd is left as given so --cd is only forwarded when the user set it.
+    args.workdir = args.cd or os.getcwd()
+
     # Resolve codex binary
     resolved = resolve_codex_bin(args.codex_bin)
     if not resolved:
@@ -477,10 +838,11 @@ def main() -> int:
     args.codex_bin = resolved
 
     # Auto-detect: if not in a git repo, automatically add --skip-git-repo-check
-    workdir = args.cd or os.getcwd()
-    if not args.skip_git_repo_check and not is_inside_git_repo(workdir):
+    if not args.skip_git_repo_check and not is_inside_git_repo(
+        args.workdir, strict=args.strict_git_check
+    ):
         print(
-            f"Note: {workdir} is not a Git repository. "
+            f"Note: {args.workdir} is not a Git repository. "
             "Automatically adding --skip-git-repo-check.",
             file=sys.stderr,
         )
@@ -488,27 +850,19 @@ def main() -> int:
 
     if args.background and args.mode != "interactive":
         cmd = build_headless_cmd(args)
-        return run_background(cmd, cwd=args.cd, log_dir=args.log_dir, notify=args.notify)
+        return run_background(cmd, cwd=args.workdir, log_dir=args.log_dir, notify=args.notify)
 
     if args.mode == "interactive":
         rc = run_interactive_tmux(args)
     else:
         cmd = build_headless_cmd(args)
         if args.clipboard:
-            # Capture output for clipboard
-            proc = subprocess.run(
-                ["script", "-q", "/dev/null"] + cmd,
-                cwd=args.cd,
-                capture_output=True,
-                text=True,
-            )
-            print(proc.stdout, end="")
-            if proc.stderr:
-                print(proc.stderr, end="", file=sys.stderr)
-            copy_to_clipboard(proc.stdout)
-            rc = proc.returncode
+            rc = run_with_clipboard(cmd, cwd=args.workdir, json_final=args.json_output)
+        elif not args.notify:
+            # Nothing left to do once codex exits: hand the process over
+            exec_with_pty(cmd, cwd=args.workdir)
         else:
-            rc = run_with_pty(cmd, cwd=args.cd)
+            rc = run_with_pty(cmd, cwd=args.workdir)
 
     # Optional notification
     if args.notify: